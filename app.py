@@ -1,10 +1,20 @@
 import streamlit as st
 import mysql.connector
+import mysql.connector.pooling
+from mysql.connector import errorcode
 import pandas as pd
 from datetime import date
+from functools import lru_cache
 import os
+import re
+import glob
+import json
+import hashlib
+import time
 from dotenv import load_dotenv
 import altair as alt
+from sqlalchemy import create_engine
+from sqlalchemy.engine import URL
 
 # page aesthetics
 st.set_page_config(page_title="University Services", layout="wide")
@@ -39,17 +49,55 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # database connection
-load_dotenv()
-
-def get_connection():
-    return mysql.connector.connect(
+@lru_cache(maxsize=1)
+def _db_kwargs():
+    # read .env and the environment once per process
+    load_dotenv()
+    return dict(
         host=os.getenv("MYSQL_HOST"),
         user=os.getenv("MYSQL_USER"),
         password=os.getenv("MYSQL_PASSWORD"),
         database=os.getenv("MYSQL_DATABASE")
     )
 
-def run_query(query, params=None):
+# pooled connections shared by all sessions; get_connection waits up to
+# POOL_WAIT seconds for one to come back before giving up
+POOL_SIZE = 8
+POOL_WAIT = 5
+
+@st.cache_resource
+def get_pool():
+    # created once per process and shared by every session
+    return mysql.connector.pooling.MySQLConnectionPool(pool_name="uni", pool_size=POOL_SIZE, **_db_kwargs())
+
+@st.cache_resource
+def get_engine():
+    # used by the read path so pandas can build arrow-backed frames;
+    # cache_resource (not cache_data) so the engine is shared, never pickled
+    db = _db_kwargs()
+    url = URL.create(
+        "mysql+mysqlconnector",
+        username=db["user"],
+        password=db["password"],
+        host=db["host"],
+        database=db["database"]
+    )
+    return create_engine(url, pool_size=POOL_SIZE, pool_pre_ping=True)
+
+def get_connection():
+    # close() on a pooled connection hands it back to the pool. The pool
+    # raises PoolError straight away when every connection is checked
+    # out, so retry briefly instead of failing concurrent sessions.
+    deadline = time.monotonic() + POOL_WAIT
+    while True:
+        try:
+            return get_pool().get_connection()
+        except mysql.connector.errors.PoolError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.05)
+
+def run_query(query, params=None, tables=None):
     conn = None
     cursor = None
     try:
@@ -57,23 +105,333 @@ def run_query(query, params=None):
         cursor = conn.cursor()
         cursor.execute(query, params)
         conn.commit()
+        clear_table_caches(tables)
         st.toast("Operation successful!", icon="✅")
+        return True
     except mysql.connector.Error as err:
         st.error(f"Error: {err}")
+        return False
     finally:
         if cursor:
             cursor.close()
-        if conn and conn.is_connected():
+        if conn:
             conn.close()
 
-def fetch_data(query, params=None):
+def run_many(query, params_list, tables=None):
+    # one round-trip and one commit for the whole batch, e.g. a bulk import
+    conn = None
+    cursor = None
     try:
         conn = get_connection()
-        df = pd.read_sql(query, conn, params=params)
+        cursor = conn.cursor()
+        cursor.executemany(query, params_list)
+        conn.commit()
+        clear_table_caches(tables)
+        st.toast(f"{cursor.rowcount} rows saved!", icon="✅")
+        return True
+    except mysql.connector.Error as err:
+        if conn:
+            conn.rollback()
+        st.error(f"Error: {err}")
+        return False
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def _read_sql(query, params=None):
+    return pd.read_sql(query, get_engine(), params=params, dtype_backend="pyarrow")
+
+# seconds a cached read may be reused, in memory and on disk. Writes made
+# through this app clear both tiers; a change from outside the app can
+# stay hidden for up to 2 * CACHE_TTL, because a disk copy up to
+# CACHE_TTL old is kept in memory for another CACHE_TTL once loaded
+CACHE_TTL = 300
+
+# second cache tier on disk, so the first visitor after a restart does
+# not pay for the heavier queries
+DISK_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+def _disk_cache_path(name, query, params):
+    digest = hashlib.sha1(repr((query, params)).encode()).hexdigest()[:16]
+    return os.path.join(DISK_CACHE_DIR, f"{name}_{digest}.parquet")
+
+def _read_sql_persisted(name, query, params=None):
+    # like _read_sql, but served from a fresh parquet copy when there is one
+    path = _disk_cache_path(name, query, params)
+    try:
+        if time.time() - os.path.getmtime(path) < CACHE_TTL:
+            return pd.read_parquet(path, engine="pyarrow", dtype_backend="pyarrow")
+        # expired copies are removed here, so files don't pile up
+        os.remove(path)
+    except (OSError, ValueError):
+        # missing or unreadable copy, fall through to the database
+        pass
+
+    df = _read_sql(query, params)
+    try:
+        os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+        tmp = path + ".tmp"
+        df.to_parquet(tmp, engine="pyarrow", index=False)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return df
+
+def clear_disk_cache(name):
+    for path in glob.glob(os.path.join(DISK_CACHE_DIR, f"{name}_*.parquet")):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def _read_row(query, params=None):
+    # single-row results (metrics) as a plain tuple, skipping pandas
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute(query, params)
+        return cursor.fetchone()
+    finally:
+        cursor.close()
         conn.close()
-        return df
+
+def fetch_data(fetcher, *args, default=None):
+    # the cached readers below raise on database errors, so a failure is
+    # never memoized; callers get an empty result instead
+    try:
+        return fetcher(*args)
     except Exception as e:
-        return pd.DataFrame()
+        return pd.DataFrame() if default is None else default
+
+# schema additions applied on startup, in order
+SCHEMA_FILES = ["schema_indexes.sql", "schema_summary.sql"]
+
+# "already exists" errors are fine when a file is re-applied
+SCHEMA_EXISTS_ERRORS = (errorcode.ER_DUP_KEYNAME, errorcode.ER_DUP_FIELDNAME, errorcode.ER_TRG_ALREADY_EXISTS)
+
+def read_sql_script(name):
+    # split a .sql file into statements, skipping '#' comment lines
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+    with open(path) as f:
+        script = "".join(line for line in f if not line.lstrip().startswith("#"))
+    return [statement for statement in script.split(";") if statement.strip()]
+
+@st.cache_resource
+def ensure_schema():
+    # runs the SCHEMA_FILES once per process; errors propagate so a failed
+    # run is not cached and the next rerun tries again
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        for name in SCHEMA_FILES:
+            for statement in read_sql_script(name):
+                try:
+                    cursor.execute(statement)
+                except mysql.connector.Error as err:
+                    # MySQL has no ADD COLUMN / CREATE INDEX IF NOT EXISTS
+                    if err.errno not in SCHEMA_EXISTS_ERRORS:
+                        raise
+        conn.commit()
+    finally:
+        cursor.close()
+        conn.close()
+
+def prefix_term(text):
+    # LIKE pattern for the indexed full_name_lc prefix search
+    escaped = text.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped + "%"
+
+def fulltext_term(text):
+    # every word must match as a prefix, e.g. "jo le" -> "+jo* +le*"
+    return " ".join(f"+{word}*" for word in re.findall(r"\w+", text))
+
+# cached readers, one per query so that a write only invalidates the
+# readers of the tables it touched (see TABLE_CACHES).
+# cache_resource hands every caller the same DataFrame instead of
+# unpickling a fresh copy per hit like cache_data does. Treat results as
+# read-only: st.dataframe, the chart builders and the dropdowns only read
+# them, so call .copy() first if a frame ever needs to be modified.
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def fetch_students():
+    return _read_sql("SELECT student_id, first_name, last_name, email FROM Students")
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def fetch_services():
+    return _read_sql("SELECT service_id, service_name, base_cost FROM Services")
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def fetch_history(search_term, show_all):
+    # only the most recent rows unless the user asks for everything
+    limit_sql = "" if show_all else f" LIMIT {HISTORY_LIMIT}"
+
+    if search_term:
+        sql = """
+        SELECT v.student_id, v.student_name, v.service_name, v.service_date, v.service_cost
+        FROM (
+            SELECT student_id FROM Students WHERE full_name_lc LIKE %s
+            UNION
+            SELECT student_id FROM Students
+            WHERE MATCH(first_name, last_name) AGAINST (%s IN BOOLEAN MODE)
+        ) AS m
+        JOIN vw_student_services v ON v.student_id = m.student_id
+        ORDER BY v.service_date DESC
+        """ + limit_sql
+        # each branch is an index lookup: the full name as typed, or any
+        # word prefix (e.g. a last name) via the full-text index. A derived
+        # table, not IN (... UNION ...), which MySQL can't turn into a
+        # semi-join; the matches are found once and joined on student_id.
+        # search results stay memory-only: one file per term would only pile up
+        return _read_sql(sql, (prefix_term(search_term), fulltext_term(search_term)))
+
+    return _read_sql_persisted(
+        "fetch_history",
+        "SELECT student_id, student_name, service_name, service_date, service_cost "
+        "FROM vw_student_services ORDER BY service_date DESC" + limit_sql
+    )
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def fetch_cost_summary():
+    # maintained by triggers, see schema_summary.sql
+    return _read_sql_persisted("fetch_cost_summary", "SELECT student_id, total_cost FROM student_cost_summary WHERE service_count > 0")
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def fetch_popularity():
+    return _read_sql_persisted("fetch_popularity", """
+    SELECT sv.service_name, COUNT(*) as usage_count
+    FROM StudentServices ss
+    JOIN Services sv ON ss.service_id = sv.service_id
+    GROUP BY sv.service_name
+    """)
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def fetch_metrics():
+    # all three metrics in a single round-trip
+    return _read_row("""
+    SELECT
+        (SELECT COUNT(*) FROM Students),
+        (SELECT COUNT(*) FROM StudentServices),
+        (SELECT COALESCE(ROUND(AVG(service_cost), 2), 0) FROM StudentServices)
+    """)
+
+# dropdown options for the assign tab; tolist() gives plain Python
+# values, which mysql.connector can bind (numpy scalars it cannot)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def student_option_map():
+    df = fetch_students()
+    return tuple(
+        (f"{fn} {ln}", sid)
+        for sid, fn, ln in zip(df['student_id'].tolist(), df['first_name'].tolist(), df['last_name'].tolist())
+    )
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def service_option_map():
+    df = fetch_services()
+    return tuple(
+        (f"{name} (${cost})", (svc_id, cost))
+        for svc_id, name, cost in zip(df['service_id'].tolist(), df['service_name'].tolist(), df['base_cost'].tolist())
+    )
+
+# cached readers that depend on each table
+TABLE_CACHES = {
+    "Students": (fetch_students, student_option_map, fetch_history, fetch_metrics),
+    "Services": (fetch_services, service_option_map, fetch_history, fetch_popularity),
+    "StudentServices": (fetch_history, fetch_cost_summary, fetch_popularity, fetch_metrics),
+}
+
+def clear_table_caches(tables):
+    # drop only the memoized reads that a write to these tables affects;
+    # callers that don't say which tables they touched clear everything
+    if tables is None:
+        tables = TABLE_CACHES
+    for table in tables:
+        for reader in TABLE_CACHES[table]:
+            reader.clear()
+            clear_disk_cache(reader.__name__)
+
+# served by Streamlit at app/static/ (enableStaticServing in .streamlit/config.toml)
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+def publish_chart_data(name, records):
+    # called on every render, outside any cache, so the file a spec points
+    # at always exists. The file name carries a content hash: a changed
+    # dataset gets a new URL and the browser never shows a stale copy.
+    # Returns None if the file can't be written (e.g. read-only app dir).
+    payload = json.dumps(records)
+    digest = hashlib.sha1(payload.encode()).hexdigest()[:12]
+    filename = f"{name}_{digest}.json"
+    path = os.path.join(STATIC_DIR, filename)
+
+    if not os.path.exists(path):
+        try:
+            os.makedirs(STATIC_DIR, exist_ok=True)
+            tmp = path + ".tmp"
+            with open(tmp, "w") as f:
+                f.write(payload)
+            os.replace(tmp, path)
+        except OSError:
+            return None
+        # only the current dataset is referenced, drop the older ones
+        for old in glob.glob(os.path.join(STATIC_DIR, f"{name}_*.json")):
+            if old != path:
+                try:
+                    os.remove(old)
+                except OSError:
+                    pass
+
+    return f"app/static/{filename}"
+
+def cost_chart_records(df):
+    return [
+        {"student_id": sid, "total_cost": float(cost)}
+        for sid, cost in zip(df['student_id'].tolist(), df['total_cost'].tolist())
+    ]
+
+# chart specs are cached on their inputs, so the Vega-Lite JSON is only
+# rebuilt when the underlying data changes
+@st.cache_data(show_spinner=False)
+def build_cost_chart(data_url=None, records=None):
+    # one row per student, so the rows are normally served from data_url,
+    # a static file the browser can cache, instead of being inlined into
+    # every spec; records (plain dicts) are the inline fallback when no
+    # file could be written
+    if data_url:
+        data = alt.Data(url=data_url, format=alt.DataFormat(type='json'))
+    else:
+        data = alt.Data(values=records)
+    chart = alt.Chart(data).mark_bar(cornerRadiusTopLeft=5, cornerRadiusTopRight=5).encode(
+        x=alt.X('student_id:N', title='Student ID', sort=None),
+        y=alt.Y('total_cost:Q', title='Total Cost ($)'),
+        color=alt.Color('total_cost:Q', scale=alt.Scale(scheme='blues'), legend=None),
+        tooltip=['student_id:N', 'total_cost:Q']
+    ).properties(height=350)
+    # st.altair_chart had no row cap; keep it that way for to_dict()
+    with alt.data_transformers.disable_max_rows():
+        return chart.to_dict()
+
+@st.cache_data(show_spinner=False)
+def build_popularity_chart(df):
+    # horizontal bar chart sorted by popularity
+    chart = alt.Chart(df).mark_bar(cornerRadiusBottomRight=5, cornerRadiusTopRight=5).encode(
+        x=alt.X('usage_count', title='Count'),
+        y=alt.Y('service_name', title='Service Name', sort='-x'),
+        color=alt.Color('service_name', legend=None),
+        tooltip=['service_name', 'usage_count']
+    ).properties(height=350)
+    with alt.data_transformers.disable_max_rows():
+        return chart.to_dict()
+
+try:
+    ensure_schema()
+except mysql.connector.Error as err:
+    st.error(f"Error: {err}")
+
+# rows shown in the service history table by default
+HISTORY_LIMIT = 200
+
+# shorter names are below MySQL's default full-text token size
+MIN_SEARCH_LENGTH = 3
 
 # navigation bar
 st.title("University Services System")
@@ -87,17 +445,15 @@ tab_dash, tab_students, tab_services, tab_assign = st.tabs([
 ])
 
 # main dashboard
-with tab_dash:
+# each page is a fragment, so a widget on one page only reruns that page
+@st.fragment
+def dashboard():
     st.markdown("### Operational Overview")
     
     # quick metrics rows
     col1, col2, col3 = st.columns(3)
     
-    total_students = fetch_data("SELECT COUNT(*) as count FROM Students").iloc[0]['count']
-    total_services = fetch_data("SELECT COUNT(*) as count FROM StudentServices").iloc[0]['count']
-    
-    avg_cost_df = fetch_data("SELECT AVG(service_cost) as avg_cost FROM StudentServices")
-    avg_cost = round(avg_cost_df.iloc[0]['avg_cost'], 2) if not avg_cost_df.empty and avg_cost_df.iloc[0]['avg_cost'] else 0.0
+    total_students, total_services, avg_cost = fetch_data(fetch_metrics, default=(0, 0, 0.0))
 
     col1.metric("Total Students", total_students, delta_color="off")
     col2.metric("Total Services", total_services, delta_color="off")
@@ -105,19 +461,24 @@ with tab_dash:
 
     st.markdown("---")
 
+    # every chart and the history table need at least one service record;
+    # the metrics row already counted them, so an empty database skips
+    # the charts' queries without another round-trip
+    has_records = total_services > 0
+
     # charts row
     # cost per student chart
     st.markdown("##### Total Cost per Student")
-    df_cost = fetch_data("SELECT * FROM vw_total_cost_per_student")
+    df_cost = fetch_data(fetch_cost_summary) if has_records else pd.DataFrame()
     
     if not df_cost.empty:
-        chart_cost = alt.Chart(df_cost).mark_bar(cornerRadiusTopLeft=5, cornerRadiusTopRight=5).encode(
-            x=alt.X('student_id', title='Student ID', sort=None),
-            y=alt.Y('total_cost', title='Total Cost ($)'),
-            color=alt.Color('total_cost', scale=alt.Scale(scheme='blues'), legend=None),
-            tooltip=['student_id', 'total_cost']
-        ).properties(height=350)
-        st.altair_chart(chart_cost, use_container_width=True)
+        cost_records = cost_chart_records(df_cost)
+        data_url = publish_chart_data("cost", cost_records)
+        if data_url:
+            spec = build_cost_chart(data_url=data_url)
+        else:
+            spec = build_cost_chart(records=cost_records)
+        st.vega_lite_chart(spec, use_container_width=True)
     else:
         st.info("No cost data available.")
 
@@ -125,23 +486,10 @@ with tab_dash:
 
     # popularity chart
     st.markdown("##### Service Popularity")
-    sql_popularity = """
-    SELECT sv.service_name, COUNT(*) as usage_count
-    FROM StudentServices ss
-    JOIN Services sv ON ss.service_id = sv.service_id
-    GROUP BY sv.service_name
-    """
-    df_popularity = fetch_data(sql_popularity)
+    df_popularity = fetch_data(fetch_popularity) if has_records else pd.DataFrame()
     
     if not df_popularity.empty:
-        # horizontal bar chart sorted by popularity
-        chart_pop = alt.Chart(df_popularity).mark_bar(cornerRadiusBottomRight=5, cornerRadiusTopRight=5).encode(
-            x=alt.X('usage_count', title='Count'),
-            y=alt.Y('service_name', title='Service Name', sort='-x'),
-            color=alt.Color('service_name', legend=None),
-            tooltip=['service_name', 'usage_count']
-        ).properties(height=350)
-        st.altair_chart(chart_pop, use_container_width=True)
+        st.vega_lite_chart(build_popularity_chart(df_popularity), use_container_width=True)
     else:
         st.info("No service data available.")
 
@@ -149,14 +497,18 @@ with tab_dash:
     st.markdown("---")
     st.markdown("##### Recent Service History")
     
-    col_search, col_dummy = st.columns([1, 2])
-    search_term = col_search.text_input("Filter by Student Name", placeholder="Type a name...")
+    col_search, col_show_all = st.columns([1, 2])
+    # a form only reruns on submit, not on every keystroke
+    with col_search.form("search_form"):
+        search_term = st.text_input("Filter by Student Name", placeholder="Type a name...").strip()
+        st.form_submit_button("Search")
+    show_all = col_show_all.checkbox("Show all")
     
-    if search_term:
-        sql = "SELECT * FROM vw_student_services WHERE student_name LIKE %s"
-        df_history = fetch_data(sql, (f"%{search_term}%",))
-    else:
-        df_history = fetch_data("SELECT * FROM vw_student_services")
+    if search_term and len(search_term) < MIN_SEARCH_LENGTH:
+        col_search.caption(f"Type at least {MIN_SEARCH_LENGTH} characters to search.")
+        search_term = ""
+    
+    df_history = fetch_data(fetch_history, search_term, show_all) if has_records else pd.DataFrame()
         
     st.dataframe(
         df_history, 
@@ -172,12 +524,13 @@ with tab_dash:
     )
 
 # second page: manage students
-with tab_students:
+@st.fragment
+def manage_students():
     c1, c2 = st.columns([2, 1])
     
     with c1:
         st.markdown("##### Current Students")
-        students = fetch_data("SELECT * FROM Students")
+        students = fetch_data(fetch_students)
         st.dataframe(students, use_container_width=True, hide_index=True)
         
     with c2:
@@ -192,8 +545,8 @@ with tab_students:
                 if st.form_submit_button("Save Student", use_container_width=True):
                     if s_id and f_name:
                         sql = "INSERT INTO Students (student_id, first_name, last_name, email) VALUES (%s, %s, %s, %s)"
-                        run_query(sql, (s_id, f_name, l_name, email))
-                        st.rerun()
+                        if run_query(sql, (s_id, f_name, l_name, email), tables=("Students",)):
+                            st.rerun()
                     else:
                         st.warning("Missing details.")
         
@@ -202,16 +555,17 @@ with tab_students:
             del_id = st.text_input("ID to Delete")
             if st.button("Delete", type="primary", use_container_width=True):
                  if del_id:
-                    run_query("DELETE FROM Students WHERE student_id = %s", (del_id,))
-                    st.rerun()
+                    if run_query("DELETE FROM Students WHERE student_id = %s", (del_id,), tables=("Students",)):
+                        st.rerun()
 
 # third page: manage services
-with tab_services:
+@st.fragment
+def manage_services():
     c1, c2 = st.columns([2, 1])
     
     with c1:
         st.markdown("##### Available Services")
-        services = fetch_data("SELECT * FROM Services")
+        services = fetch_data(fetch_services)
         st.dataframe(services, use_container_width=True, hide_index=True)
         
     with c2:
@@ -223,20 +577,18 @@ with tab_services:
                 
                 if st.form_submit_button("Save Service", use_container_width=True):
                     sql = "INSERT INTO Services (service_name, base_cost) VALUES (%s, %s)"
-                    run_query(sql, (s_name, cost))
-                    st.rerun()
+                    if run_query(sql, (s_name, cost), tables=("Services",)):
+                        st.rerun()
 
 # fourth page: assign services
-with tab_assign:
+@st.fragment
+def assign_services():
     st.markdown("##### Create New Service Record")
     
-    students = fetch_data("SELECT student_id, first_name, last_name FROM Students")
-    services = fetch_data("SELECT service_id, service_name, base_cost FROM Services")
+    student_options = dict(fetch_data(student_option_map, default=()))
+    service_options = dict(fetch_data(service_option_map, default=()))
     
-    if not students.empty and not services.empty:
-        student_options = {f"{row['first_name']} {row['last_name']}": row['student_id'] for index, row in students.iterrows()}
-        service_options = {f"{row['service_name']} (${row['base_cost']})": (row['service_id'], row['base_cost']) for index, row in services.iterrows()}
-        
+    if student_options and service_options:
         with st.container(border=True):
             col1, col2 = st.columns(2)
             
@@ -254,6 +606,21 @@ with tab_assign:
                 svc_id = service_options[sel_service_label][0]
                 
                 sql = "INSERT INTO StudentServices (student_id, service_id, service_date, service_cost) VALUES (%s, %s, %s, %s)"
-                run_query(sql, (s_id, svc_id, service_date, final_cost))
+                # full rerun so the dashboard fragment picks up the new record;
+                # on failure stay put so the error stays visible
+                if run_query(sql, (s_id, svc_id, service_date, final_cost), tables=("StudentServices",)):
+                    st.rerun()
     else:
-        st.warning("Add students and services first.")
\ No newline at end of file
+        st.warning("Add students and services first.")
+
+with tab_dash:
+    dashboard()
+
+with tab_students:
+    manage_students()
+
+with tab_services:
+    manage_services()
+
+with tab_assign:
+    assign_services()
@@ -0,0 +1,19 @@
+#Indexes for the dashboard's hot queries
+#Applied by app.py on startup; indexes and columns that already exist are skipped.
+
+#Service popularity joins StudentServices to Services on service_id
+CREATE INDEX idx_ss_service
+ON StudentServices(service_id);
+
+#Name lookups and ordering on Students
+CREATE INDEX idx_students_name
+ON Students(last_name, first_name);
+
+#Full-text index so the name search does not need a leading-wildcard LIKE
+CREATE FULLTEXT INDEX idx_students_name_ft
+ON Students(first_name, last_name);
+
+#Lower-cased full name for indexed prefix search ("john l" -> 'john l%')
+ALTER TABLE Students
+ADD COLUMN full_name_lc VARCHAR(101) AS (LOWER(CONCAT(first_name, ' ', last_name))) STORED,
+ADD INDEX idx_students_full_name_lc (full_name_lc);
@@ -0,0 +1,56 @@
+#Materialized total cost per student
+#Replaces reads of vw_total_cost_per_student on the dashboard. Triggers keep it
+#current on every insert/update/delete; app.py applies this file on startup and
+#the backfill below recomputes the totals from StudentServices each time.
+CREATE TABLE IF NOT EXISTS student_cost_summary (
+    student_id VARCHAR(10) PRIMARY KEY,
+    total_cost DECIMAL(10,2) NOT NULL DEFAULT 0,
+    service_count INT NOT NULL DEFAULT 0
+);
+
+#Backfill / refresh from the bridge table
+INSERT INTO student_cost_summary (student_id, total_cost, service_count)
+SELECT * FROM (
+    SELECT student_id, SUM(service_cost) AS total_cost, COUNT(*) AS service_count
+    FROM StudentServices
+    WHERE student_id IS NOT NULL
+    GROUP BY student_id
+) AS t
+ON DUPLICATE KEY UPDATE total_cost = t.total_cost, service_count = t.service_count;
+
+#Add the new record's cost to its student's total
+CREATE TRIGGER trg_ss_cost_insert
+AFTER INSERT ON StudentServices
+FOR EACH ROW
+INSERT INTO student_cost_summary (student_id, total_cost, service_count)
+SELECT NEW.student_id, IFNULL(NEW.service_cost, 0), 1 FROM DUAL
+WHERE NEW.student_id IS NOT NULL
+ON DUPLICATE KEY UPDATE
+    total_cost = total_cost + IFNULL(NEW.service_cost, 0),
+    service_count = service_count + 1;
+
+#Subtract a removed record's cost
+CREATE TRIGGER trg_ss_cost_delete
+AFTER DELETE ON StudentServices
+FOR EACH ROW
+UPDATE student_cost_summary
+SET total_cost = total_cost - IFNULL(OLD.service_cost, 0),
+    service_count = service_count - 1
+WHERE student_id = OLD.student_id;
+
+#Move an edited record's cost: take the OLD values off and add the NEW ones.
+#One upsert over a derived table (kept to a single statement, no BEGIN/END),
+#so a changed student_id or service_cost both stay correct.
+CREATE TRIGGER trg_ss_cost_update
+AFTER UPDATE ON StudentServices
+FOR EACH ROW
+INSERT INTO student_cost_summary (student_id, total_cost, service_count)
+SELECT * FROM (
+    SELECT OLD.student_id AS student_id, -IFNULL(OLD.service_cost, 0) AS cost_delta, -1 AS count_delta
+    UNION ALL
+    SELECT NEW.student_id, IFNULL(NEW.service_cost, 0), 1
+) AS d
+WHERE d.student_id IS NOT NULL
+ON DUPLICATE KEY UPDATE
+    total_cost = total_cost + d.cost_delta,
+    service_count = service_count + d.count_delta;